@@ -3,6 +3,7 @@
 # Standard Library
 # pylint: disable=too-many-public-methods
 import os
+from collections import namedtuple
 from gettext import gettext as _
 
 from gi.repository import Gio, Gtk
@@ -25,6 +26,113 @@ from lutris.util.strings import gtk_safe
 from lutris.util.system import path_exists
 
 
+# Labels of the game actions, translated once
+GAME_ACTION_LABELS = {
+    "play": _("Play"),
+    "stop": _("Stop"),
+    "install": _("Install"),
+    "update": _("Install updates"),
+    "install_dlcs": "Install DLCs",
+    "show_logs": _("Show logs"),
+    "add": _("Add installed game"),
+    "duplicate": _("Duplicate"),
+    "configure": _("Configure"),
+    "favorite": _("Add to favorites"),
+    "deletefavorite": _("Remove from favorites"),
+    "execute-script": _("Execute script"),
+    "browse": _("Browse files"),
+    "desktop-shortcut": _("Create desktop shortcut"),
+    "rm-desktop-shortcut": _("Delete desktop shortcut"),
+    "menu-shortcut": _("Create application menu shortcut"),
+    "rm-menu-shortcut": _("Delete application menu shortcut"),
+    "steam-shortcut": _("Create steam shortcut"),
+    "rm-steam-shortcut": _("Delete steam shortcut"),
+    "install_more": _("Install another version"),
+    "remove": _("Remove"),
+    "view": _("View on Lutris.net"),
+    "hide": _("Hide game from library"),
+    "unhide": _("Unhide game from library"),
+}
+
+# Name of the GameActions callback for each action, in menu order
+GAME_ACTION_CALLBACKS = {
+    "play": "on_game_launch",
+    "stop": "on_game_stop",
+    "install": "on_install_clicked",
+    "update": "on_update_clicked",
+    "install_dlcs": "on_install_dlc_clicked",
+    "show_logs": "on_show_logs",
+    "add": "on_add_manually",
+    "duplicate": "on_game_duplicate",
+    "configure": "on_edit_game_configuration",
+    "favorite": "on_add_favorite_game",
+    "deletefavorite": "on_delete_favorite_game",
+    "execute-script": "on_execute_script_clicked",
+    "browse": "on_browse_files",
+    "desktop-shortcut": "on_create_desktop_shortcut",
+    "rm-desktop-shortcut": "on_remove_desktop_shortcut",
+    "menu-shortcut": "on_create_menu_shortcut",
+    "rm-menu-shortcut": "on_remove_menu_shortcut",
+    "steam-shortcut": "on_create_steam_shortcut",
+    "rm-steam-shortcut": "on_remove_steam_shortcut",
+    "install_more": "on_install_clicked",
+    "remove": "on_remove_game",
+    "view": "on_view_game",
+    "hide": "on_hide_game",
+    "unhide": "on_unhide_game",
+}
+
+
+# State of a game that decides which of its actions are displayed
+GameState = namedtuple("GameState", (
+    "installed",
+    "running",
+    "favorite",
+    "hidden",
+    "updatable",
+    "browser",
+    "has_service",
+    "has_manual_command",
+    "desktop_shortcut",
+    "menu_shortcut",
+    "steam_shortcut",
+    "steam_game",
+))
+
+# Whether each action is displayed, given the GameState of a game
+DISPLAYED_ENTRY_RULES = (
+    ("add", lambda state: not state.installed),
+    ("duplicate", lambda state: True),
+    ("install", lambda state: not state.installed),
+    ("play", lambda state: state.installed and not state.running),
+    ("update", lambda state: state.updatable),
+    ("install_dlcs", lambda state: state.updatable),
+    ("stop", lambda state: state.running),
+    ("configure", lambda state: state.installed),
+    ("browse", lambda state: state.installed and not state.browser),
+    ("show_logs", lambda state: state.installed),
+    ("favorite", lambda state: not state.favorite),
+    ("deletefavorite", lambda state: state.favorite),
+    ("install_more", lambda state: state.installed and not state.has_service),
+    ("execute-script", lambda state: state.installed and state.has_manual_command),
+    ("desktop-shortcut", lambda state: state.installed and not state.desktop_shortcut),
+    ("menu-shortcut", lambda state: state.installed and not state.menu_shortcut),
+    ("steam-shortcut", lambda state: state.installed and not state.steam_shortcut and not state.steam_game),
+    ("rm-desktop-shortcut", lambda state: state.desktop_shortcut),
+    ("rm-menu-shortcut", lambda state: state.menu_shortcut),
+    ("rm-steam-shortcut", lambda state: state.steam_shortcut and not state.steam_game),
+    ("remove", lambda state: True),
+    ("view", lambda state: True),
+    ("hide", lambda state: state.installed and not state.hidden),
+    ("unhide", lambda state: state.hidden),
+)
+
+
+def get_displayed_entries_for_state(state):
+    """Return a dictionary of the actions that should be shown for a game in `state`"""
+    return {key: rule(state) for key, rule in DISPLAYED_ENTRY_RULES}
+
+
 class GameActions:
     """Regroup a list of callbacks for a game"""
 
@@ -44,7 +152,7 @@ class GameActions:
 
     @property
     def is_game_running(self):
-        return bool(self.application.get_game_by_id(self.game_id))
+        return bool(self.game_id) and int(self.game_id) in self.application.running_game_ids
 
     def set_game(self, game=None, game_id=None):
         if game:
@@ -57,107 +165,38 @@ class GameActions:
     def get_game_actions(self):
         """Return a list of game actions and their callbacks"""
         return [
-            ("play", _("Play"), self.on_game_launch),
-            ("stop", _("Stop"), self.on_game_stop),
-            ("install", _("Install"), self.on_install_clicked),
-            ("update", _("Install updates"), self.on_update_clicked),
-            ("install_dlcs", "Install DLCs", self.on_install_dlc_clicked),
-            ("show_logs", _("Show logs"), self.on_show_logs),
-            ("add", _("Add installed game"), self.on_add_manually),
-            ("duplicate", _("Duplicate"), self.on_game_duplicate),
-            ("configure", _("Configure"), self.on_edit_game_configuration),
-            ("favorite", _("Add to favorites"), self.on_add_favorite_game),
-            ("deletefavorite", _("Remove from favorites"), self.on_delete_favorite_game),
-            ("execute-script", _("Execute script"), self.on_execute_script_clicked),
-            ("browse", _("Browse files"), self.on_browse_files),
-            (
-                "desktop-shortcut",
-                _("Create desktop shortcut"),
-                self.on_create_desktop_shortcut,
-            ),
-            (
-                "rm-desktop-shortcut",
-                _("Delete desktop shortcut"),
-                self.on_remove_desktop_shortcut,
-            ),
-            (
-                "menu-shortcut",
-                _("Create application menu shortcut"),
-                self.on_create_menu_shortcut,
-            ),
-            (
-                "rm-menu-shortcut",
-                _("Delete application menu shortcut"),
-                self.on_remove_menu_shortcut,
-            ),
-            (
-                "steam-shortcut",
-                _("Create steam shortcut"),
-                self.on_create_steam_shortcut,
-            ),
-            (
-                "rm-steam-shortcut",
-                _("Delete steam shortcut"),
-                self.on_remove_steam_shortcut,
-            ),
-            ("install_more", _("Install another version"), self.on_install_clicked),
-            ("remove", _("Remove"), self.on_remove_game),
-            ("view", _("View on Lutris.net"), self.on_view_game),
-            ("hide", _("Hide game from library"), self.on_hide_game),
-            ("unhide", _("Unhide game from library"), self.on_unhide_game),
+            (key, GAME_ACTION_LABELS[key], getattr(self, callback))
+            for key, callback in GAME_ACTION_CALLBACKS.items()
         ]
 
     def get_displayed_entries(self):
         """Return a dictionary of actions that should be shown for a game"""
-        return {
-            "add": not self.game.is_installed,
-            "duplicate": True,
-            "install": not self.game.is_installed,
-            "play": self.game.is_installed and not self.is_game_running,
-            "update": self.game.is_updatable,
-            "install_dlcs": self.game.is_updatable,
-            "stop": self.is_game_running,
-            "configure": bool(self.game.is_installed),
-            "browse": self.game.is_installed and self.game.runner_name != "browser",
-            "show_logs": self.game.is_installed,
-            "favorite": not self.game.is_favorite,
-            "deletefavorite": self.game.is_favorite,
-            "install_more": not self.game.service and self.game.is_installed,
-            "execute-script": bool(
-                self.game.is_installed and self.game.runner
-                and self.game.runner.system_config.get("manual_command")
-            ),
-            "desktop-shortcut": (
-                self.game.is_installed
-                and not xdgshortcuts.desktop_launcher_exists(self.game.slug, self.game.id)
-            ),
-            "menu-shortcut": (
-                self.game.is_installed
-                and not xdgshortcuts.menu_launcher_exists(self.game.slug, self.game.id)
-            ),
-            "steam-shortcut": (
-                self.game.is_installed
-                and not steam_shortcut.shortcut_exists(self.game)
-                and not steam_shortcut.is_steam_game(self.game)
-            ),
-            "rm-desktop-shortcut": bool(
-                self.game.is_installed
-                and xdgshortcuts.desktop_launcher_exists(self.game.slug, self.game.id)
-            ),
-            "rm-menu-shortcut": bool(
-                self.game.is_installed
-                and xdgshortcuts.menu_launcher_exists(self.game.slug, self.game.id)
-            ),
-            "rm-steam-shortcut": bool(
-                self.game.is_installed
-                and steam_shortcut.shortcut_exists(self.game)
-                and not steam_shortcut.is_steam_game(self.game)
-            ),
-            "remove": True,
-            "view": True,
-            "hide": self.game.is_installed and not self.game.is_hidden,
-            "unhide": self.game.is_hidden,
-        }
+        game = self.game
+        installed = bool(game.is_installed)
+        runner = game.runner
+        # Shortcuts are only offered for installed games, skip the lookups otherwise
+        desktop_shortcut = menu_shortcut = steam_shortcut_exists = is_steam_game = False
+        if installed:
+            slug, game_id = game.slug, game.id
+            desktop_shortcut = xdgshortcuts.desktop_launcher_exists(slug, game_id)
+            menu_shortcut = xdgshortcuts.menu_launcher_exists(slug, game_id)
+            steam_shortcut_exists = steam_shortcut.shortcut_exists(game)
+            is_steam_game = steam_shortcut.is_steam_game(game)
+        state = GameState(
+            installed=installed,
+            running=self.is_game_running,
+            favorite=bool(game.is_favorite),
+            hidden=bool(game.is_hidden),
+            updatable=bool(game.is_updatable),
+            browser=game.runner_name == "browser",
+            has_service=bool(game.service),
+            has_manual_command=bool(installed and runner and runner.system_config.get("manual_command")),
+            desktop_shortcut=bool(desktop_shortcut),
+            menu_shortcut=bool(menu_shortcut),
+            steam_shortcut=bool(steam_shortcut_exists),
+            steam_game=bool(is_steam_game),
+        )
+        return get_displayed_entries_for_state(state)
 
     def on_game_launch(self, *_args):
         """Launch a game"""
@@ -165,9 +204,8 @@ class GameActions:
 
     def get_running_game(self):
         ids = self.application.get_running_game_ids()
-        for game_id in ids:
-            if str(game_id) == str(self.game.id):
-                return self.game
+        if int(self.game.id) in ids:
+            return self.game
         logger.warning("Game %s not in %s", self.game_id, ids)
 
     def on_game_stop(self, _caller):
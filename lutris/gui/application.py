@@ -21,6 +21,7 @@ import os
 import signal
 import sys
 import tempfile
+from collections import Counter
 
 from datetime import datetime, timedelta
 from gettext import gettext as _
@@ -77,6 +78,9 @@ class Application(Gtk.Application):
         self.window = None
 
         self.running_games = Gio.ListStore.new(Game)
+        # Number of entries in running_games for each game ID (as ints), the same
+        # game can be launched more than once
+        self.running_game_ids = Counter()
         self.app_windows = {}
         self.tray = None
         self.css_provider = Gtk.CssProvider.new()
@@ -613,6 +617,7 @@ class Application(Gtk.Application):
 
     def on_game_start(self, game):
         self.running_games.append(game)
+        self.running_game_ids[int(game.id)] += 1
         if settings.read_setting("hide_client_on_game_start") == "True":
             self.window.hide()  # Hide launcher window
         return True
@@ -666,11 +671,8 @@ class Application(Gtk.Application):
         return True
 
     def get_running_game_ids(self):
-        ids = []
-        for i in range(self.running_games.get_n_items()):
-            game = self.running_games.get_item(i)
-            ids.append(str(game.id))
-        return ids
+        """Return the IDs of the running games as a set of ints"""
+        return frozenset(self.running_game_ids)
 
     def get_game_by_id(self, game_id):
         for i in range(self.running_games.get_n_items()):
@@ -681,14 +683,16 @@ class Application(Gtk.Application):
 
     def on_game_stop(self, game):
         """Callback to remove the game from the running games"""
-        ids = self.get_running_game_ids()
-        if str(game.id) in ids:
-            try:
-                self.running_games.remove(ids.index(str(game.id)))
-            except ValueError:
-                pass
+        for i in range(self.running_games.get_n_items()):
+            if str(self.running_games.get_item(i).id) == str(game.id):
+                self.running_games.remove(i)
+                game_id = int(game.id)
+                self.running_game_ids[game_id] -= 1
+                if self.running_game_ids[game_id] <= 0:
+                    del self.running_game_ids[game_id]
+                break
         else:
-            logger.warning("%s not in %s", game.id, ids)
+            logger.warning("%s not in %s", game.id, self.get_running_game_ids())
 
         game.emit("game-stopped")
         if settings.read_setting("hide_client_on_game_start") == "True" and not self.quit_on_game_exit:
@@ -1,6 +1,6 @@
 """Various utilities using the GObject framework"""
-import array
 import os
+from functools import lru_cache
 
 from gi.repository import GdkPixbuf, Gio, GLib, Gtk
 
@@ -8,11 +8,6 @@ from lutris import settings
 from lutris.util import datapath, system
 from lutris.util.log import logger
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
-
 ICON_SIZE = (32, 32)
 BANNER_SIZE = (184, 69)
 
@@ -31,26 +26,34 @@ def get_main_window(widget):
 
 def open_uri(uri):
     """Opens a local or remote URI with the default application"""
-    system.execute(["xdg-open", uri])
+    try:
+        Gio.AppInfo.launch_default_for_uri(uri, None)
+    except GLib.GError as ex:
+        logger.error("Failed to open URI %s: %s", uri, ex)
 
 
 def get_pixbuf(image, size, fallback=None, is_installed=True):
-    """Return a pixbuf from file `image` at `size` or fallback to `fallback`"""
+    """Return a pixbuf from file `image` at `size` or fallback to `fallback`.
+    The fallback pixbuf is shared between callers, the returned pixbuf must not be modified.
+    """
     width, height = size
     pixbuf = None
-    if system.path_exists(image, exclude_empty=True):
+    if image:
         try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(image, width, height)
-            pixbuf = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.NEAREST)
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(image, width, height, False)
         except GLib.GError:
-            logger.error("Unable to load icon from image %s", image)
-    else:
+            # Missing media is common and failed downloads leave empty files
+            # behind, only report actual images that can't be read
+            if system.path_exists(image, exclude_empty=True):
+                logger.error("Unable to load icon from image %s", image)
+    if not pixbuf:
         if not fallback:
             fallback = get_default_icon(size)
-        if system.path_exists(fallback):
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(fallback, width, height)
+        try:
+            pixbuf = get_cached_pixbuf(fallback, width, height)
+        except GLib.GError:
+            pixbuf = None
     if is_installed and pixbuf:
-        pixbuf = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.NEAREST)
         return pixbuf
     overlay = os.path.join(datapath.get(), "media/unavailable.png")
     transparent_pixbuf = get_overlay(overlay, size).copy()
@@ -71,15 +74,34 @@ def get_pixbuf(image, size, fallback=None, is_installed=True):
     return transparent_pixbuf
 
 
+# Paths of the runtime icons found by _resolve_icon_path
+_ICON_PATHS = {}
+
+
+def clear_icon_caches(*_args):
+    """Forget the icon lookups done so far, called when the icon theme changes"""
+    has_stock_icon.cache_clear()
+    _ICON_PATHS.clear()
+
+
+@lru_cache(maxsize=None)
+def get_icon_theme():
+    """Return the default Gtk icon theme"""
+    icon_theme = Gtk.IconTheme.get_default()
+    icon_theme.connect("changed", clear_icon_caches)
+    return icon_theme
+
+
+@lru_cache(maxsize=256)
 def has_stock_icon(name):
     """This tests if a GTK stock icon is known; if not we can try a fallback."""
-    theme = Gtk.IconTheme.get_default()
+    theme = get_icon_theme()
     return theme.has_icon(name)
 
 
 def get_stock_icon(name, size):
     """Return a pixbuf from a stock icon name"""
-    theme = Gtk.IconTheme.get_default()
+    theme = get_icon_theme()
     try:
         return theme.load_icon(name, size, Gtk.IconLookupFlags.GENERIC_FALLBACK)
     except GLib.GError:
@@ -96,9 +118,8 @@ def get_icon(icon_name, icon_format="image", size=None, icon_type="runner"):
     size -- The size for the desired image (default None)
     icon_type -- Retrieve either a 'runner' or 'platform' icon (default 'runner')
     """
-    filename = icon_name.lower().replace(" ", "") + ".png"
-    icon_path = os.path.join(settings.RUNTIME_DIR, "icons/hicolor/64x64/apps", filename)
-    if not os.path.exists(icon_path):
+    icon_path = _resolve_icon_path(icon_name)
+    if not icon_path:
         return None
     if icon_format == "image":
         icon = Gtk.Image()
@@ -112,11 +133,31 @@ def get_icon(icon_name, icon_format="image", size=None, icon_type="runner"):
     raise ValueError("Invalid arguments")
 
 
+@lru_cache(maxsize=32)
+def get_cached_pixbuf(path, width, height):
+    """Return a pixbuf of `path` at exactly `width` x `height`.
+    The same instance is returned on each call, it must not be modified.
+    """
+    return GdkPixbuf.Pixbuf.new_from_file_at_scale(path, width, height, False)
+
+
+def _resolve_icon_path(icon_name):
+    """Return the path of the runtime icon for `icon_name`, or None if there is none.
+    Missing icons are looked up again on each call since the runtime may add them later.
+    """
+    if icon_name in _ICON_PATHS:
+        return _ICON_PATHS[icon_name]
+    filename = icon_name.lower().replace(" ", "") + ".png"
+    icon_path = os.path.join(settings.RUNTIME_DIR, "icons/hicolor/64x64/apps", filename)
+    if not os.path.exists(icon_path):
+        return None
+    _ICON_PATHS[icon_name] = icon_path
+    return icon_path
+
+
 def get_overlay(overlay_path, size):
     width, height = size
-    transparent_pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(overlay_path, width, height)
-    transparent_pixbuf = transparent_pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.NEAREST)
-    return transparent_pixbuf
+    return get_cached_pixbuf(overlay_path, width, height)
 
 
 def get_default_icon(size):
@@ -125,8 +166,18 @@ def get_default_icon(size):
     return os.path.join(datapath.get(), "media/default_banner.png")
 
 
+@lru_cache(maxsize=None)
+def get_background_mask():
+    """Return the gradient mask applied to pane backgrounds"""
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+    mask = Image.open(os.path.join(datapath.get(), "media/mask.png"))
+    mask.load()
+    return mask
+
+
 def convert_to_background(background_path, target_size=(320, 1080)):
     """Converts a image to a pane background"""
+    from PIL import Image  # pylint: disable=import-outside-toplevel
     coverart = Image.open(background_path)
     coverart = coverart.convert("RGBA")
 
@@ -150,30 +201,28 @@ def convert_to_background(background_path, target_size=(320, 1080)):
 
     # Paste coverart on transparent image while applying a gradient mask
     background = Image.new('RGBA', (target_width, target_height), (0, 0, 0, 0))
-    mask = Image.open(os.path.join(datapath.get(), "media/mask.png"))
-    background.paste(coverart_bg, mask=mask)
+    background.paste(coverart_bg, mask=get_background_mask())
 
     return background
 
 
 def thumbnail_image(base_image, target_size):
+    from PIL import Image  # pylint: disable=import-outside-toplevel
     base_width, base_height = base_image.size
     base_ratio = base_width / base_height
     target_width, target_height = target_size
     target_ratio = target_width / target_height
 
-    # Resize and crop coverart
+    # Crop the source to the target ratio and resize it in a single pass
     if base_ratio >= target_ratio:
-        width = int(base_width * (target_height / base_height))
-        height = target_height
+        crop_width = base_height * target_ratio
+        x_offset = (base_width - crop_width) / 2
+        box = (x_offset, 0, x_offset + crop_width, base_height)
     else:
-        width = target_width
-        height = int(base_height * (target_width / base_width))
-    x_offset = int((width - target_width) / 2)
-    y_offset = int((height - target_height) / 2)
-    base_image = base_image.resize((width, height), resample=Image.BICUBIC)
-    base_image = base_image.crop((x_offset, y_offset, width - x_offset, height - y_offset))
-    return base_image
+        crop_height = base_width / target_ratio
+        y_offset = (base_height - crop_height) / 2
+        box = (0, y_offset, base_width, y_offset + crop_height)
+    return base_image.resize((target_width, target_height), resample=Image.BICUBIC, box=box)
 
 
 def paste_overlay(base_image, overlay_image, position=0.7):
@@ -195,9 +244,9 @@ def paste_overlay(base_image, overlay_image, position=0.7):
 
 def image2pixbuf(image):
     """Converts a PIL Image to a GDK Pixbuf"""
-    image_array = array.array('B', image.tobytes())
+    image_bytes = GLib.Bytes.new(image.tobytes("raw", "RGBA"))
     width, height = image.size
-    return GdkPixbuf.Pixbuf.new_from_data(image_array, GdkPixbuf.Colorspace.RGB, True, 8, width, height, width * 4)
+    return GdkPixbuf.Pixbuf.new_from_bytes(image_bytes, GdkPixbuf.Colorspace.RGB, True, 8, width, height, width * 4)
 
 
 def get_link_button(text):
@@ -212,7 +261,7 @@ def get_link_button(text):
 
 def load_icon_theme():
     """Add the lutris icon folder to the default theme"""
-    icon_theme = Gtk.IconTheme.get_default()
+    icon_theme = get_icon_theme()
     local_theme_path = os.path.join(settings.RUNTIME_DIR, "icons")
     if local_theme_path not in icon_theme.get_search_path():
         icon_theme.prepend_search_path(local_theme_path)
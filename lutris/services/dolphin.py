@@ -2,8 +2,6 @@ import json
 import os
 from gettext import gettext as _
 
-from PIL import Image
-
 from lutris import settings
 from lutris.services.base import BaseService
 from lutris.services.service_game import ServiceGame
@@ -97,6 +95,7 @@ class DolphinGame(ServiceGame):
 
         (width, height), data = cache_entry["volume_banner"]
         if data:
+            from PIL import Image  # pylint: disable=import-outside-toplevel
             img = Image.frombytes("RGB", (width, height), data, "raw", ("BGRX"))
             # 96x32 is a bit small, maybe 2x scale?
             # img.resize((width * 2, height * 2))
@@ -11,7 +11,7 @@ from lutris.config import LutrisConfig, write_game_config
 from lutris.database.games import add_game, get_game_by_field
 from lutris.database.services import ServiceGameCollection
 from lutris.game import Game
-from lutris.gui.widgets.utils import Image, paste_overlay, thumbnail_image
+from lutris.gui.widgets.utils import paste_overlay, thumbnail_image
 from lutris.installer import get_installers
 from lutris.services.base import AuthTokenExpired, OnlineService
 from lutris.services.service_game import ServiceGame
@@ -38,6 +38,7 @@ class DieselGameMedia(ServiceMedia):
     min_logo_y = 150
 
     def _render_filename(self, filename):
+        from PIL import Image  # pylint: disable=import-outside-toplevel
         game_box_path = os.path.join(self.dest_path, filename)
         logo_path = os.path.join(EGS_LOGO_PATH, filename.replace(".jpg", ".png"))
         has_logo = os.path.exists(logo_path)
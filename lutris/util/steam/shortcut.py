@@ -29,22 +29,31 @@ def vdf_file_exists():
     return bool(get_shortcuts_vdf_path)
 
 
-def matches_id(shortcut, game):
-    """Test if the game seems to be the one a shortcut refers to."""
+def get_shortcut_game_id(shortcut):
+    """Return the ID (as a string) of the Lutris game a shortcut launches, or None"""
     id_match = re.match(r".*lutris:rungameid/(\d+)", shortcut.get("LaunchOptions", ""))
     if not id_match:
-        return False
-    game_id = id_match.groups()[0]
-    return game_id == str(game.id)
+        return None
+    return id_match.groups()[0]
 
 
-def shortcut_exists(game):
+def matches_id(shortcut, game):
+    """Test if the game seems to be the one a shortcut refers to."""
+    return get_shortcut_game_id(shortcut) == str(game.id)
+
+
+def get_shortcut_game_ids():
+    """Return the IDs (as strings) of the Lutris games that have a Steam shortcut"""
     shortcut_path = get_shortcuts_vdf_path()
     if not shortcut_path or not os.path.exists(shortcut_path):
-        return False
+        return set()
     with open(shortcut_path, "rb") as shortcut_file:
         shortcuts = vdf.binary_loads(shortcut_file.read())['shortcuts'].values()
-    return bool([s for s in shortcuts if matches_id(s, game)])
+    return {get_shortcut_game_id(shortcut) for shortcut in shortcuts} - {None}
+
+
+def shortcut_exists(game):
+    return str(game.id) in get_shortcut_game_ids()
 
 
 def is_steam_game(game):
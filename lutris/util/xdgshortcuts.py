@@ -2,6 +2,7 @@
 import os
 import shutil
 import stat
+from functools import lru_cache
 from textwrap import dedent
 
 from gi.repository import GLib
@@ -35,25 +36,64 @@ def get_xdg_entry(directory):
     return GLib.get_user_special_dir(special_dir[directory])
 
 
+@lru_cache(maxsize=4)
+def _list_directory(directory, _mtime):
+    """Return the file names in `directory`, cached until its mtime changes"""
+    return frozenset(os.listdir(directory))
+
+
+def get_directory_listing(directory):
+    """Return the file names in `directory`, or an empty set if it can't be read.
+    The listing is reused as long as the directory isn't modified.
+    """
+    if not directory:
+        return frozenset()
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        return _list_directory(directory, mtime)
+    except OSError:
+        return frozenset()
+
+
+def find_xdg_basename(game_slug, game_id, listing):
+    """Return the first possible .desktop filename for a game found in `listing`,
+    or None if there is none
+    """
+    for path in [
+        "{}.desktop".format(game_slug),
+        "{}-{}.desktop".format(game_slug, game_id),
+        "net.lutris.{}-{}.desktop".format(game_slug, game_id),
+    ]:
+        if path in listing:
+            return path
+    return None
+
+
+def get_desktop_dir():
+    """Return the user's desktop directory, or None if there is none"""
+    return GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DESKTOP)
+
+
+def get_menu_dir():
+    """Return the directory of the user's application menu entries"""
+    return os.path.join(GLib.get_user_data_dir(), "applications")
+
+
 def get_xdg_basename(game_slug, game_id, base_dir=None):
     """Return the filename for .desktop shortcuts"""
     if base_dir:
         # When base dir is provided, lookup possible combinations
         # and return the first match
-        for path in [
-            "{}.desktop".format(game_slug),
-            "{}-{}.desktop".format(game_slug, game_id),
-            "net.lutris.{}-{}.desktop".format(game_slug, game_id),
-        ]:
-            if system.path_exists(os.path.join(base_dir, path)):
-                return path
+        path = find_xdg_basename(game_slug, game_id, get_directory_listing(base_dir))
+        if path:
+            return path
 
     return "net.lutris.{}-{}.desktop".format(game_slug, game_id)
 
 
 def create_launcher(game_slug, game_id, game_name, desktop=False, menu=False):
     """Create a .desktop file."""
-    desktop_dir = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DESKTOP)
+    desktop_dir = get_desktop_dir()
     lutris_executable = get_lutris_executable()
     launcher_content = dedent(
         """
@@ -92,9 +132,9 @@ def create_launcher(game_slug, game_id, game_name, desktop=False, menu=False):
         logger.debug("Creating Desktop icon in %s", launcher_path)
         shutil.copy(tmp_launcher_path, launcher_path)
     if menu:
-        menu_path = os.path.join(GLib.get_user_data_dir(), "applications")
-        os.makedirs(menu_path, exist_ok=True)
-        launcher_path = os.path.join(menu_path, launcher_filename)
+        menu_dir = get_menu_dir()
+        os.makedirs(menu_dir, exist_ok=True)
+        launcher_path = os.path.join(menu_dir, launcher_filename)
         logger.debug("Creating menu launcher in %s", launcher_path)
         shutil.copy(tmp_launcher_path, launcher_path)
     os.remove(tmp_launcher_path)
@@ -105,7 +145,7 @@ def get_launcher_path(game_slug, game_id):
     When legacy is set, it will return the old path with only the slug,
     otherwise it will return the path with slug + id
     """
-    desktop_dir = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DESKTOP)
+    desktop_dir = get_desktop_dir()
 
     return os.path.join(desktop_dir, get_xdg_basename(game_slug, game_id, base_dir=desktop_dir))
 
@@ -114,18 +154,20 @@ def get_menu_launcher_path(game_slug, game_id):
     """Return the path to a XDG menu launcher, prioritizing legacy paths if
     they exist
     """
-    menu_dir = os.path.join(GLib.get_user_data_dir(), "applications")
+    menu_dir = get_menu_dir()
     return os.path.join(menu_dir, get_xdg_basename(game_slug, game_id, base_dir=menu_dir))
 
 
 def desktop_launcher_exists(game_slug, game_id):
     """Return True if there is an existing desktop icon for a game"""
-    return system.path_exists(get_launcher_path(game_slug, game_id))
+    desktop_dir = get_desktop_dir()
+    return bool(find_xdg_basename(game_slug, game_id, get_directory_listing(desktop_dir)))
 
 
 def menu_launcher_exists(game_slug, game_id):
     """Return True if there is an existing application menu entry for a game"""
-    return system.path_exists(get_menu_launcher_path(game_slug, game_id))
+    menu_dir = get_menu_dir()
+    return bool(find_xdg_basename(game_slug, game_id, get_directory_listing(menu_dir)))
 
 
 def remove_launcher(game_slug, game_id, desktop=False, menu=False):
@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+import gi
+
+gi.require_version('Gtk', '3.0')
+
+from lutris.game_actions import GAME_ACTION_CALLBACKS, GameState, get_displayed_entries_for_state
+
+
+def get_state(**kwargs):
+    """Return the GameState of an uninstalled game, updated with kwargs"""
+    state = {field: False for field in GameState._fields}
+    state.update(kwargs)
+    return GameState(**state)
+
+
+def get_expected_entries(**kwargs):
+    """Return the entries that are always displayed, updated with kwargs"""
+    entries = {key: False for key in GAME_ACTION_CALLBACKS}
+    entries.update({"duplicate": True, "remove": True, "view": True, "favorite": True})
+    entries.update(kwargs)
+    return entries
+
+
+class TestDisplayedEntries(TestCase):
+    def test_game_not_installed(self):
+        self.assertEqual(
+            get_displayed_entries_for_state(get_state()),
+            get_expected_entries(add=True, install=True),
+        )
+
+    def test_installed_game_running(self):
+        entries = get_displayed_entries_for_state(get_state(installed=True, running=True))
+        self.assertEqual(
+            entries,
+            get_expected_entries(**{
+                "stop": True,
+                "configure": True,
+                "browse": True,
+                "show_logs": True,
+                "install_more": True,
+                "desktop-shortcut": True,
+                "menu-shortcut": True,
+                "steam-shortcut": True,
+                "hide": True,
+            }),
+        )
+
+    def test_installed_game_with_shortcuts(self):
+        state = get_state(installed=True, desktop_shortcut=True, menu_shortcut=True, steam_shortcut=True)
+        self.assertEqual(
+            get_displayed_entries_for_state(state),
+            get_expected_entries(**{
+                "play": True,
+                "configure": True,
+                "browse": True,
+                "show_logs": True,
+                "install_more": True,
+                "rm-desktop-shortcut": True,
+                "rm-menu-shortcut": True,
+                "rm-steam-shortcut": True,
+                "hide": True,
+            }),
+        )
+
+    def test_steam_game_has_no_steam_shortcut_entries(self):
+        for steam_shortcut in (False, True):
+            state = get_state(installed=True, steam_game=True, steam_shortcut=steam_shortcut)
+            entries = get_displayed_entries_for_state(state)
+            self.assertFalse(entries["steam-shortcut"])
+            self.assertFalse(entries["rm-steam-shortcut"])
+
+    def test_hidden_game(self):
+        entries = get_displayed_entries_for_state(get_state(installed=True, hidden=True))
+        self.assertFalse(entries["hide"])
+        self.assertTrue(entries["unhide"])
+        entries = get_displayed_entries_for_state(get_state(hidden=True))
+        self.assertFalse(entries["hide"])
+        self.assertTrue(entries["unhide"])
+
+    def test_browser_game_cannot_be_browsed(self):
+        entries = get_displayed_entries_for_state(get_state(installed=True, browser=True))
+        self.assertFalse(entries["browse"])
+        self.assertTrue(entries["play"])
+        self.assertTrue(entries["configure"])
+
+    def test_favorite_service_game_with_updates_and_script(self):
+        state = get_state(installed=True, favorite=True, has_service=True, updatable=True, has_manual_command=True)
+        entries = get_displayed_entries_for_state(state)
+        self.assertFalse(entries["favorite"])
+        self.assertTrue(entries["deletefavorite"])
+        self.assertFalse(entries["install_more"])
+        self.assertTrue(entries["update"])
+        self.assertTrue(entries["install_dlcs"])
+        self.assertTrue(entries["execute-script"])
@@ -0,0 +1,32 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import gi
+
+gi.require_version('Gtk', '3.0')
+
+from PIL import Image
+
+from lutris.gui.widgets.utils import thumbnail_image
+
+
+class TestThumbnailImage(TestCase):
+    def get_thumbnail(self, base_size, target_size):
+        base_image = Image.new("RGBA", base_size)
+        with patch.object(base_image, "resize", wraps=base_image.resize) as resize:
+            thumbnail = thumbnail_image(base_image, target_size)
+        return thumbnail, resize
+
+    def test_wider_image_is_cropped_horizontally(self):
+        thumbnail, resize = self.get_thumbnail((400, 100), (100, 100))
+        self.assertEqual(thumbnail.size, (100, 100))
+        resize.assert_called_once_with((100, 100), resample=Image.BICUBIC, box=(150, 0, 250, 100))
+
+    def test_taller_image_is_cropped_vertically(self):
+        thumbnail, resize = self.get_thumbnail((300, 200), (200, 100))
+        self.assertEqual(thumbnail.size, (200, 100))
+        resize.assert_called_once_with((200, 100), resample=Image.BICUBIC, box=(0, 25, 300, 175))
+
+    def test_output_has_exactly_the_target_size(self):
+        thumbnail, _resize = self.get_thumbnail((333, 127), (200, 267))
+        self.assertEqual(thumbnail.size, (200, 267))
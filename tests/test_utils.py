@@ -2,7 +2,12 @@ import os
 from collections import OrderedDict
 from unittest import TestCase
 
-from lutris.util import fileio, strings, system
+import gi
+
+gi.require_version('Gtk', '3.0')
+
+from lutris.util import fileio, strings, system, xdgshortcuts
+from lutris.util.steam import shortcut as steam_shortcut
 from lutris.util.steam import vdfutils
 
 
@@ -59,6 +64,16 @@ class TestSteamUtils(TestCase):
         vdf_data = vdfutils.to_vdf(dict_data)
         self.assertEqual(vdf_data.strip(), expected_vdf.strip())
 
+    def test_get_shortcut_game_id(self):
+        shortcut = {"LaunchOptions": "lutris:rungameid/1234"}
+        self.assertEqual(steam_shortcut.get_shortcut_game_id(shortcut), "1234")
+        shortcut = {"LaunchOptions": "env LUTRIS_SKIP_INIT=1 lutris lutris:rungameid/56"}
+        self.assertEqual(steam_shortcut.get_shortcut_game_id(shortcut), "56")
+
+    def test_get_shortcut_game_id_ignores_other_shortcuts(self):
+        self.assertIsNone(steam_shortcut.get_shortcut_game_id({"LaunchOptions": "-fullscreen"}))
+        self.assertIsNone(steam_shortcut.get_shortcut_game_id({}))
+
 
 class TestStringUtils(TestCase):
     def test_slugify_with_nonwestern_name(self):
@@ -173,3 +188,23 @@ class TestSubstitute(TestCase):
     def test_can_sub_game_files_with_dashes_in_key(self):
         replacements = {'steam-data': '/tmp'}
         self.assertEqual(system.substitute('--path=$steam-data', replacements), '--path=/tmp')
+
+
+class TestXdgShortcuts(TestCase):
+    def test_find_xdg_basename_returns_none_without_launcher(self):
+        listing = {"net.lutris.quake-12.desktop", "firefox.desktop"}
+        self.assertIsNone(xdgshortcuts.find_xdg_basename("doom", 10, listing))
+
+    def test_find_xdg_basename_finds_current_name(self):
+        listing = {"net.lutris.doom-10.desktop"}
+        self.assertEqual(xdgshortcuts.find_xdg_basename("doom", 10, listing), "net.lutris.doom-10.desktop")
+
+    def test_find_xdg_basename_prefers_legacy_names(self):
+        listing = {"doom.desktop", "doom-10.desktop", "net.lutris.doom-10.desktop"}
+        self.assertEqual(xdgshortcuts.find_xdg_basename("doom", 10, listing), "doom.desktop")
+        listing = {"doom-10.desktop", "net.lutris.doom-10.desktop"}
+        self.assertEqual(xdgshortcuts.find_xdg_basename("doom", 10, listing), "doom-10.desktop")
+
+    def test_find_xdg_basename_checks_the_game_id(self):
+        listing = {"net.lutris.doom-11.desktop"}
+        self.assertIsNone(xdgshortcuts.find_xdg_basename("doom", 10, listing))